@@ -12,6 +12,12 @@ import subprocess
 import sys
 import types
 
+# Packages already resolved by ensure_package, keyed by package name
+_loaded: dict[str, types.ModuleType] = {}
+
+# Entries known to be on sys.path, to avoid a linear scan per call
+_known_paths: set[str] = set(sys.path)
+
 
 def _get_cache_dir(plugin_name: str) -> str:
     """Get a reliable cache directory for dependencies."""
@@ -39,25 +45,32 @@ def ensure_package(package_name: str, plugin_name: str = "default") -> types.Mod
     Returns:
         The imported module
     """
+    module = _loaded.get(package_name)
+    if module is not None:
+        return module
+
     cache_dir = _get_cache_dir(plugin_name)
 
     # Add cache dir to path if not already there
-    if cache_dir not in sys.path:
+    if cache_dir not in _known_paths:
         sys.path.insert(0, cache_dir)
+        _known_paths.add(cache_dir)
 
     # Try importing first
     try:
         module = __import__(package_name)
         # Verify module is functional (not a broken partial install)
         if hasattr(module, "__version__") or hasattr(module, "__file__"):
+            _loaded[package_name] = module
             return module
     except Exception:
         pass
 
     # Clear any broken cached imports
-    for mod in list(sys.modules.keys()):
-        if mod == package_name or mod.startswith(f"{package_name}."):
-            del sys.modules[mod]
+    sys.modules.pop(package_name, None)
+    prefix = f"{package_name}."
+    for mod in [mod for mod in sys.modules if mod.startswith(prefix)]:
+        del sys.modules[mod]
 
     # Install to cache directory
     try:
@@ -67,7 +80,9 @@ def ensure_package(package_name: str, plugin_name: str = "default") -> types.Mod
             [sys.executable, "-m", "pip", "install", package_name, "--target", cache_dir, "--upgrade", "--quiet"],
             check=True,
         )
-        return __import__(package_name)
+        module = __import__(package_name)
+        _loaded[package_name] = module
+        return module
     except Exception:
         pass
 
@@ -77,6 +92,8 @@ def ensure_package(package_name: str, plugin_name: str = "default") -> types.Mod
             [sys.executable, "-m", "pip", "install", package_name, "--user", "--quiet"],
             check=False,
         )
-        return __import__(package_name)
+        module = __import__(package_name)
+        _loaded[package_name] = module
+        return module
     except Exception:
         raise ImportError(f"Failed to install or import {package_name}")
@@ -4,13 +4,19 @@ from .dynamic_deps import ensure_package
 psutil = ensure_package("psutil", plugin_name="killprocess")  # type: ignore[assignment]
 
 import asyncio
+import os
 import platform
+import signal
+import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Dict
+from operator import itemgetter
+from typing import TYPE_CHECKING, Dict
 from wox_plugin import (
     ActionContext,
     Context,
+    LogLevel,
     Plugin,
     PluginInitParams,
     PublicAPI,
@@ -25,6 +31,42 @@ from wox_plugin import (
 
 from .process_name_resolver import ProcessNameResolver
 
+if TYPE_CHECKING:
+    from psutil import Process
+
+_SYSTEM = platform.system()
+_IS_DARWIN = _SYSTEM == "Darwin"
+_IS_WINDOWS = _SYSTEM == "Windows"
+
+# Per-process psutil calls are fanned out to worker threads in chunks of this size; name
+# resolution for new processes blocks on I/O and PyObjC, so allow a few more workers than cores
+_COLLECT_CHUNK_SIZE = 64
+_COLLECT_WORKERS = min(8, (os.cpu_count() or 1) + 4)
+
+# New processes in one refresh from which a single running-applications snapshot beats per-pid lookups
+_APP_SNAPSHOT_MIN_NEWCOMERS = 16
+
+# Refresh every second while results are on screen, back off while Wox is idle
+_ACTIVE_REFRESH_INTERVAL = 1
+_IDLE_REFRESH_INTERVAL = 10
+
+# Upper bound on results returned per query; the best scored matches are kept
+_MAX_RESULTS = 200
+
+
+def _format_app_path(exe_path: str) -> str:
+    """Format path for display - truncate to .app on macOS."""
+    if not exe_path:
+        return exe_path
+
+    if _IS_DARWIN:
+        # Truncate to the .app bundle, using the same rule as the name resolver
+        bundle_path = ProcessNameResolver.get_app_bundle_path(exe_path)
+        if bundle_path:
+            return bundle_path
+
+    return exe_path
+
 
 @dataclass
 class ProcessInfo:
@@ -34,62 +76,127 @@ class ProcessInfo:
     username: str
     memory_mb: float
     friendly_name: str
+    create_time: float
+    # Stable result id and display strings, rendered once per refresh
+    result_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    title: str = ""
+    pid_text: str = ""
+    memory_text: str = ""
+    # Lowercased copies for query() filtering, computed once per process
+    name_lower: str = field(init=False)
+    exe_lower: str = field(init=False)
+    friendly_lower: str = field(init=False)
+    # Display path and icon, fixed for the lifetime of the process
+    sub_title: str = field(init=False)
+    icon: WoxImage = field(init=False)
+    # Kill action, built on first display and reused since it only depends on the pid
+    actions: list[ResultAction] = field(init=False, default_factory=list)
+
+    def __post_init__(self) -> None:
+        self.name_lower = self.name.lower()
+        self.exe_lower = self.exe_path.lower()
+        self.friendly_lower = self.friendly_name.lower()
+        self.sub_title = _format_app_path(self.exe_path) or self.name
+        self.icon = WoxImage(image_type=WoxImageType.FILE_ICON, image_data=self.sub_title)
 
 
 @dataclass
 class TrackedResult:
     result_id: str
     pid: int
+    # Texts last sent to Wox, to skip updates that would change nothing
+    title: str = ""
+    memory_text: str = ""
 
 
 class MyPlugin(Plugin):
     api: PublicAPI
     name_resolver: ProcessNameResolver
     _processes: Dict[int, ProcessInfo] = field(default_factory=dict)
+    # _processes as a list, for query() to iterate
+    _process_list: list[ProcessInfo] = field(default_factory=list)
     _tracked_results: Dict[str, TrackedResult] = field(default_factory=dict)
     _refresh_task: asyncio.Task | None = None
     _lock: asyncio.Lock = field(default_factory=asyncio.Lock)
-
-    @staticmethod
-    def _format_app_path(exe_path: str) -> str:
-        """Format path for display - truncate to .app on macOS."""
-        if not exe_path:
-            return exe_path
-
-        if platform.system() == "Darwin":
-            # Find .app in the path and truncate to that level
-            app_index = exe_path.find(".app")
-            if app_index != -1:
-                # Include the .app part
-                return exe_path[: app_index + 4]
-
-        return exe_path
+    _ready: asyncio.Event = field(default_factory=asyncio.Event)
+    _translations: Dict[str, str] = field(default_factory=dict)
+    # Last successfully fetched (title, pid, memory) templates, reused if a later fetch fails
+    _render_templates: tuple[str, str, str] | None = None
+    _executor: ThreadPoolExecutor
+    _refresh_event: asyncio.Event = field(default_factory=asyncio.Event)
+    _last_refresh: float = 0.0
+    # Last error logged by the refresh path, so a persistent failure is not logged on every tick
+    _last_error: str | None = None
 
     async def init(self, _ctx: Context, init_params: PluginInitParams) -> None:
         self.api = init_params.api
         self.name_resolver = ProcessNameResolver()
         self._processes = {}
+        self._process_list = []
         self._tracked_results = {}
         self._lock = asyncio.Lock()
+        self._ready = asyncio.Event()
+        self._translations = {}
+        self._render_templates = None
+        self._refresh_event = asyncio.Event()
+        self._last_refresh = 0.0
+        self._last_error = None
+        self._executor = ThreadPoolExecutor(max_workers=_COLLECT_WORKERS, thread_name_prefix="killprocess")
+        await self.api.on_unload(_ctx, self._on_unload)
 
         # Start background refresh task
         self._refresh_task = asyncio.create_task(self._refresh_processes_loop())
 
+    async def _on_unload(self, _ctx: Context) -> None:
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        # process_iter() keeps Process instances cached between calls since psutil 6.0
+        cache_clear = getattr(psutil.process_iter, "cache_clear", None)
+        if cache_clear is not None:
+            cache_clear()
+
     async def _t(self, ctx: Context, key: str, **kwargs) -> str:
         """Get translated string with parameter substitution."""
-        template = await self.api.get_translation(ctx, key)
+        template = self._translations.get(key)
+        if template is None:
+            template = await self.api.get_translation(ctx, key)
+            self._translations[key] = template
         if kwargs:
             return template.format(**kwargs)
         return template
 
+    def invalidate_translations(self) -> None:
+        """Drop cached translation templates so the next lookup fetches them again."""
+        self._translations.clear()
+
     async def kill_process(self, ctx: Context, pid: int) -> None:
+        # Results only ever list cached pids, so a pid missing from the cache has already exited
+        process = self._processes.get(pid)
+        if process is None:
+            await self.api.notify(ctx, await self._t(ctx, "notify_no_process", pid=str(pid)))
+            return
+
+        # os.kill(0) would signal our own process group; pid 0 is the kernel (e.g. kernel_task on macOS)
+        if pid <= 0:
+            await self.api.notify(ctx, await self._t(ctx, "notify_access_denied", pid=str(pid)))
+            return
+
         try:
-            process = psutil.Process(pid)
-            process.terminate()
+            # os.kill does no pid reuse check, so make sure the pid still belongs to the listed process
+            current = psutil.Process(pid)
+            if process.create_time and current.create_time() != process.create_time:
+                raise psutil.NoSuchProcess(pid)
+
+            if _IS_WINDOWS:
+                # Windows needs psutil for TerminateProcess
+                current.terminate()
+            else:
+                os.kill(pid, signal.SIGTERM)
             await self.api.notify(ctx, await self._t(ctx, "notify_success", pid=str(pid)))
-        except psutil.NoSuchProcess:
+        except (psutil.NoSuchProcess, ProcessLookupError):
             await self.api.notify(ctx, await self._t(ctx, "notify_no_process", pid=str(pid)))
-        except psutil.AccessDenied:
+        except (psutil.AccessDenied, PermissionError):
             await self.api.notify(ctx, await self._t(ctx, "notify_access_denied", pid=str(pid)))
         except Exception as e:
             await self.api.notify(ctx, await self._t(ctx, "notify_error", pid=str(pid), error=str(e)))
@@ -101,101 +208,255 @@ class MyPlugin(Plugin):
         except ValueError:
             await self.api.notify(Context.new(), "i18n:notify_invalid_pid")
 
+    async def _log_error(self, ctx: Context, message: str) -> None:
+        """Log a refresh error through Wox, once per run of identical failures."""
+        if message == self._last_error:
+            return
+        self._last_error = message
+        try:
+            await self.api.log(ctx, LogLevel.ERROR, message)
+        except Exception:
+            # The failing RPC may be the connection to Wox itself, so there is nowhere left to report to
+            pass
+
     async def _refresh_processes_loop(self) -> None:
         """Background task to periodically refresh process list."""
         while True:
-            await self._refresh_processes()
-            await asyncio.sleep(1)
+            try:
+                await self._refresh_processes()
+                self._last_error = None
+            except Exception as e:
+                # Keep refreshing on the next tick rather than leaving the cache stale until reload
+                await self._log_error(Context.new(), f"Error refreshing processes: {str(e)}")
+            finally:
+                # Never leave the first query() waiting on a scan that failed before publishing
+                self._ready.set()
+
+            # Sleep until the next tick, or until a query asks for fresher data
+            interval = _ACTIVE_REFRESH_INTERVAL if self._tracked_results else _IDLE_REFRESH_INTERVAL
+            try:
+                await asyncio.wait_for(self._refresh_event.wait(), timeout=interval)
+            except asyncio.TimeoutError:
+                pass
+            self._refresh_event.clear()
+
+    def _collect_processes(self, procs: list["Process"]) -> tuple[Dict[int, ProcessInfo], list[tuple["Process", float, float]]]:
+        """
+        Refresh already known processes in a chunk. Runs on a worker thread.
+
+        Returns the carried-forward processes, plus (process, create_time, memory_mb) for processes seen for the first time.
+        """
+        collected: Dict[int, ProcessInfo] = {}
+        newcomers: list[tuple["Process", float, float]] = []
+
+        for proc in procs:
+            try:
+                # Query fields directly instead of through process_iter(attrs)/as_dict(), and only
+                # what is needed: carried-forward processes just need their memory refreshed
+                pid = proc.pid
+                # process_iter() hands back its cached Process, whose create_time() is memoized; is_running()
+                # re-reads the identity from the OS, so a reused pid is looked at through a fresh Process
+                if not proc.is_running():
+                    proc = psutil.Process(pid)
+
+                create_time = 0.0
+                try:
+                    create_time = proc.create_time()
+                except psutil.AccessDenied:
+                    pass
+
+                memory_mb = 0.0
+                try:
+                    memory_mb = proc.memory_info().rss / (1024 * 1024)
+                except psutil.AccessDenied:
+                    pass
+
+                # Exe path and friendly name never change for the lifetime of a process,
+                # so reuse them when the same process (pid + create_time) was seen before
+                known = self._processes.get(pid)
+                if known is not None and known.create_time == create_time:
+                    known.memory_mb = memory_mb
+                    collected[pid] = known
+                    continue
+
+                newcomers.append((proc, create_time, memory_mb))
+            except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+                continue
+
+        return collected, newcomers
+
+    def _create_process_info(
+        self, proc: "Process", create_time: float, memory_mb: float, pid_map: dict[int, str] | None
+    ) -> ProcessInfo | None:
+        """Resolve name, user, exe path and friendly name for a newly seen process. Runs on a worker thread."""
+        try:
+            friendly_name = self.name_resolver.get_friendly_name(proc, pid_map)
+
+            # One oneshot() fetch; fields we may not read come back as None instead of raising
+            pinfo = proc.as_dict(attrs=["name", "username", "exe"], ad_value=None)
+
+            return ProcessInfo(
+                pid=proc.pid,
+                name=pinfo["name"] or "",
+                exe_path=pinfo["exe"] or "",
+                username=pinfo["username"] or "N/A",
+                memory_mb=memory_mb,
+                friendly_name=friendly_name,
+                create_time=create_time,
+            )
+        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+            return None
 
     async def _refresh_processes(self) -> None:
         """Refresh the cached process list and update tracked results."""
+        # The lock only serializes refreshes; query() reads the published snapshot without waiting on it
         async with self._lock:
+            loop = asyncio.get_running_loop()
+            # Listing processes blocks, so run it off the event loop. psutil >= 6.0 no longer re-checks
+            # create_time for PID reuse on every process_iter() call (giampaolo/psutil#2404), so the
+            # listing itself stays cheap; _collect_processes() checks identity instead
+            procs = await loop.run_in_executor(self._executor, list, psutil.process_iter())
+
+            # Overlap the per-process syscalls across worker threads, keeping the event loop free
+            chunks = await asyncio.gather(
+                *(
+                    loop.run_in_executor(self._executor, self._collect_processes, procs[i : i + _COLLECT_CHUNK_SIZE])
+                    for i in range(0, len(procs), _COLLECT_CHUNK_SIZE)
+                )
+            )
+
             new_processes: Dict[int, ProcessInfo] = {}
+            newcomers: list[tuple["Process", float, float]] = []
+            for collected, chunk_newcomers in chunks:
+                new_processes.update(collected)
+                newcomers.extend(chunk_newcomers)
+
+            # Enumerate macOS applications once for a large batch (e.g. the first refresh); a few new
+            # processes are cheaper to look up one pid at a time
+            pid_map = None
+            if len(newcomers) >= _APP_SNAPSHOT_MIN_NEWCOMERS:
+                pid_map = await loop.run_in_executor(self._executor, self.name_resolver.get_running_app_names)
+
+            # Resolve new processes one task each, so slow name lookups spread across the whole pool
+            created = await asyncio.gather(
+                *(
+                    loop.run_in_executor(self._executor, self._create_process_info, proc, create_time, memory_mb, pid_map)
+                    for proc, create_time, memory_mb in newcomers
+                )
+            )
+            for proc_info in created:
+                if proc_info is not None:
+                    new_processes[proc_info.pid] = proc_info
 
-            for proc in psutil.process_iter(["pid", "name", "username", "memory_info"]):
-                try:
-                    pinfo = proc.info
-                    proc_obj = psutil.Process(pinfo["pid"])
-                    friendly_name = self.name_resolver.get_friendly_name(proc_obj)
-
-                    memory_mb = 0
-                    try:
-                        memory_info = pinfo["memory_info"]
-                        memory_mb = memory_info.rss / (1024 * 1024) if memory_info else 0
-                    except Exception:
-                        pass
-
-                    exe_path = ""
-                    try:
-                        exe_path = proc_obj.exe() or ""
-                    except Exception:
-                        pass
-
-                    new_processes[pinfo["pid"]] = ProcessInfo(
-                        pid=pinfo["pid"],
-                        name=pinfo["name"],
-                        exe_path=exe_path,
-                        username=pinfo["username"] or "N/A",
-                        memory_mb=memory_mb,
-                        friendly_name=friendly_name,
-                    )
-                except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
-                    continue
+            process_list = list(new_processes.values())
+            await self._render_processes(process_list)
 
-            self._processes = new_processes
+            self._publish_processes(new_processes, process_list)
 
             # Update tracked results
             await self._update_tracked_results()
 
-    async def _create_tails(self, ctx: Context, proc_info: ProcessInfo) -> list[ResultTail]:
-        """Create result tails for PID and memory info."""
-        tails = []
-
-        # PID tail
-        pid_text = await self._t(ctx, "tail_pid", pid=str(proc_info.pid))
-        tails.append(ResultTail(type=ResultTailType.TEXT, text=pid_text))
+    def _publish_processes(self, processes: Dict[int, ProcessInfo], process_list: list[ProcessInfo]) -> None:
+        """Swap in a rendered process snapshot. Never awaits, so query() never sees it half swapped."""
+        self._processes = processes
+        self._process_list = process_list
+        self._last_refresh = time.monotonic()
+        self._ready.set()
 
-        # Memory tail
-        memory_text = await self._t(ctx, "tail_memory", memory_mb=f"{proc_info.memory_mb:.1f}")
-        tails.append(ResultTail(type=ResultTailType.TEXT, text=memory_text))
+    async def _render_processes(self, process_list: list[ProcessInfo]) -> None:
+        """Render title and tail texts for the given processes with one template fetch per key."""
+        ctx = Context.new()
+        try:
+            templates = await asyncio.gather(
+                self._t(ctx, "process_title"),
+                self._t(ctx, "tail_pid"),
+                self._t(ctx, "tail_memory"),
+            )
+        except Exception as e:
+            # Without any templates yet there is nothing to render with, so let this refresh fail
+            if self._render_templates is None:
+                raise
+            await self._log_error(ctx, f"Error fetching translations: {str(e)}")
+            templates = self._render_templates
+        self._render_templates = templates
+        title_template, pid_template, memory_template = templates
+
+        for proc_info in process_list:
+            proc_info.title = title_template.format(friendly_name=proc_info.friendly_name, pid=str(proc_info.pid))
+            proc_info.pid_text = pid_template.format(pid=str(proc_info.pid))
+            proc_info.memory_text = memory_template.format(memory_mb=f"{proc_info.memory_mb:.1f}")
 
-        return tails
+    @staticmethod
+    def _create_tails(proc_info: ProcessInfo) -> list[ResultTail]:
+        """Create result tails for PID and memory info."""
+        return [
+            ResultTail(type=ResultTailType.TEXT, text=proc_info.pid_text),
+            ResultTail(type=ResultTailType.TEXT, text=proc_info.memory_text),
+        ]
+
+    async def _update_tracked_result(self, ctx: Context, result_id: str, tracked: TrackedResult) -> bool:
+        """Push fresh process data to a single tracked result. Returns False if it should stop being tracked."""
+        # Check if process still exists (and the pid was not reused by another process)
+        process = self._processes.get(tracked.pid)
+        if not process or process.result_id != result_id:
+            return False
+
+        # Nothing visible changed since the last push (title and path are fixed, memory often is too)
+        if process.title == tracked.title and process.memory_text == tracked.memory_text:
+            return True
+
+        # Get updatable result (returns None if no longer visible)
+        updatable = await self.api.get_updatable_result(ctx, result_id)
+        if updatable is None:
+            return False
+
+        # Update the result data
+        updatable.title = process.title
+        updatable.sub_title = process.sub_title
+        updatable.tails = self._create_tails(process)
+
+        # Try to update the result, False means it is no longer visible
+        if not await self.api.update_result(ctx, updatable):
+            return False
+
+        tracked.title = process.title
+        tracked.memory_text = process.memory_text
+        return True
 
     async def _update_tracked_results(self) -> None:
         """Update all tracked results with fresh process data."""
-        to_remove: list[str] = []
-        ctx = Context.new()
-
-        for result_id, tracked in self._tracked_results.items():
-            # Check if process still exists
-            process = self._processes.get(tracked.pid)
-            if not process:
-                to_remove.append(result_id)
-                continue
-
-            try:
-                # Get updatable result (returns None if no longer visible)
-                updatable = await self.api.get_updatable_result(ctx, result_id)
-                if updatable is None:
-                    to_remove.append(result_id)
-                    continue
+        if not self._tracked_results:
+            return
 
-                # Update the result data
-                updatable.title = await self._t(ctx, "process_title", friendly_name=process.friendly_name, pid=str(process.pid))
-                updatable.sub_title = self._format_app_path(process.exe_path) or process.name
-                updatable.tails = await self._create_tails(ctx, process)
+        # query() keeps running while this awaits, and may re-track the same stable ids in the meantime
+        tracked_items = list(self._tracked_results.items())
 
-                # Try to update the result
-                success = await self.api.update_result(ctx, updatable)
-                if not success:
-                    # Result no longer visible
-                    to_remove.append(result_id)
-            except Exception:
-                to_remove.append(result_id)
+        # Results cannot be on screen while Wox is hidden, so stop tracking them altogether
+        ctx = Context.new()
+        try:
+            visible = await self.api.is_visible(ctx)
+        except Exception as e:
+            # Assume the results may still be on screen; the per-result updates fail on their own if not
+            await self._log_error(ctx, f"Error checking visibility: {str(e)}")
+            visible = True
+        if not visible:
+            self._untrack(tracked_items)
+            return
+
+        # Updates are independent, so issue them concurrently instead of one round trip at a time
+        outcomes = await asyncio.gather(
+            *(self._update_tracked_result(ctx, result_id, tracked) for result_id, tracked in tracked_items),
+            return_exceptions=True,
+        )
 
         # Remove stale results
-        for result_id in to_remove:
-            self._tracked_results.pop(result_id, None)
+        self._untrack([item for item, keep in zip(tracked_items, outcomes) if keep is not True])
+
+    def _untrack(self, tracked_items: list[tuple[str, TrackedResult]]) -> None:
+        """Stop tracking the given results, leaving entries a newer query has tracked since untouched."""
+        for result_id, tracked in tracked_items:
+            if self._tracked_results.get(result_id) is tracked:
+                del self._tracked_results[result_id]
 
     async def query(self, ctx: Context, query: Query) -> list[Result]:
         results: list[Result] = []
@@ -204,47 +465,68 @@ class MyPlugin(Plugin):
         # Clear previous tracked results
         self._tracked_results.clear()
 
-        # Use cached process list
-        async with self._lock:
-            for pid, proc_info in list(self._processes.items()):
-                process_name = proc_info.name.lower()
-                friendly_name = proc_info.friendly_name
-                exe_path = proc_info.exe_path.lower()
-
-                # Filter processes if search term exists
-                if (
-                    search_term
-                    and search_term not in process_name
-                    and search_term not in friendly_name.lower()
-                    and search_term not in exe_path
-                ):
+        # Wake the background refresh if the cache was filled while idle
+        if time.monotonic() - self._last_refresh > _ACTIVE_REFRESH_INTERVAL:
+            self._refresh_event.set()
+
+        # Wox has no locale-change hook, so re-fetch templates once per query to pick up language switches
+        self.invalidate_translations()
+
+        # Only the very first query has to wait for a scan; later ones read the last published snapshot
+        if not self._ready.is_set():
+            await self._ready.wait()
+
+        # Score the cached process list first, so Result objects are only built for the ones returned
+        matches: list[tuple[int, ProcessInfo]] = []
+        for proc_info in self._process_list:
+            # Filter processes if search term exists, scoring name matches above path matches
+            score = 50
+            if search_term:
+                if search_term in proc_info.name_lower or search_term in proc_info.friendly_lower:
+                    score = 100
+                elif search_term not in proc_info.exe_lower:
                     continue
-
-                result_id = str(uuid.uuid4())
-                exec_path = self._format_app_path(proc_info.exe_path) or proc_info.name
-                result = Result(
-                    title=await self._t(ctx, "process_title", friendly_name=friendly_name, pid=str(pid)),
-                    sub_title=exec_path,
-                    icon=WoxImage(image_type=WoxImageType.FILE_ICON, image_data=exec_path),
-                    tails=await self._create_tails(ctx, proc_info),
-                    actions=[
-                        ResultAction(
-                            name="i18n:kill_action",
-                            context_data={"pid": str(pid)},
-                            prevent_hide_after_action=True,
-                            action=self.action,
-                        )
-                    ],
-                    id=result_id,
-                    score=(100 if search_term and (search_term in process_name or search_term in friendly_name.lower()) else 50),
-                )
-                results.append(result)
-
-                # Track this result for updates
-                self._tracked_results[result_id] = TrackedResult(
-                    result_id=result_id,
-                    pid=pid,
-                )
+            matches.append((score, proc_info))
+
+            # An empty search scores every process the same, so stop once enough are listed
+            if not search_term and len(matches) >= _MAX_RESULTS:
+                break
+
+        # The sort is stable, so equally scored processes keep their cached order
+        matches.sort(key=itemgetter(0), reverse=True)
+        del matches[_MAX_RESULTS:]
+
+        for score, proc_info in matches:
+            actions = proc_info.actions
+            if not actions:
+                actions = proc_info.actions = [
+                    ResultAction(
+                        name="i18n:kill_action",
+                        context_data={"pid": str(proc_info.pid)},
+                        prevent_hide_after_action=True,
+                        action=self.action,
+                    )
+                ]
+
+            result_id = proc_info.result_id
+            result = Result(
+                title=proc_info.title,
+                sub_title=proc_info.sub_title,
+                icon=proc_info.icon,
+                tails=self._create_tails(proc_info),
+                actions=actions,
+                id=result_id,
+                score=score,
+            )
+            results.append(result)
+
+            # Track this result for updates
+            self._tracked_results[result_id] = TrackedResult(
+                result_id=result_id,
+                pid=proc_info.pid,
+                title=proc_info.title,
+                memory_text=proc_info.memory_text,
+            )
 
         return results
 
@@ -1,30 +1,71 @@
+import configparser
 import os
 import platform
+import shlex
+import threading
+import time
+from collections import OrderedDict
 from typing import Optional
 
 import psutil
 
+_SYSTEM = platform.system()
+_IS_DARWIN = _SYSTEM == "Darwin"
+_IS_LINUX = _SYSTEM == "Linux"
+
 # Import platform specific modules
-if platform.system() == "Darwin":
+if _IS_DARWIN:
     try:
-        from AppKit import NSURL, NSBundle, NSWorkspace  # type: ignore
+        from AppKit import NSURL, NSBundle, NSRunningApplication, NSWorkspace  # type: ignore
     except ImportError:
         NSURL = None  # type: ignore
         NSBundle = None  # type: ignore
+        NSRunningApplication = None  # type: ignore
         NSWorkspace = None  # type: ignore
 else:
     NSURL = None  # type: ignore
     NSBundle = None  # type: ignore
+    NSRunningApplication = None  # type: ignore
     NSWorkspace = None  # type: ignore
 
+# Exec= launchers that run some other program; indexing them would give every shell the first app's Name
+_DESKTOP_EXEC_WRAPPERS = frozenset({"env", "sh", "bash", "dash", "zsh", "flatpak"})
+
 
 class ProcessNameResolver:
-    def __init__(self):
-        self._cache: dict[int, tuple[str, float]] = {}  # type: ignore
+    def __init__(self) -> None:
+        # (pid, create_time) -> (friendly name, resolved at), least recently used first
+        self._cache: OrderedDict[tuple[int, float], tuple[str, float]] = OrderedDict()
         self._cache_expiration = 60  # Cache expiration time in seconds
+        self._cache_max_size = 4096
+        # get_friendly_name is called from worker threads
+        self._cache_lock = threading.Lock()
+
+        # Linux: executable basename -> Name from .desktop files, rebuilt when a directory changes
+        self._desktop_paths = [
+            "/usr/share/applications/",
+            "/usr/local/share/applications/",
+            os.path.expanduser("~/.local/share/applications/"),
+        ]
+        self._desktop_index: dict[str, str] = {}
+        self._desktop_mtime: dict[str, float] = {}
+        self._desktop_checked_at: Optional[float] = None
+        self._desktop_lock = threading.Lock()
+
+        # macOS: .app bundle path -> display name (None if unavailable); bundle names are stable
+        self._bundle_name_cache: dict[str, Optional[str]] = {}
 
     def _get_macos_app_name_from_bundle(self, app_path: str) -> Optional[str]:
-        """Get application name from macOS bundle."""
+        """Get application name from macOS bundle, cached per bundle path."""
+        if app_path in self._bundle_name_cache:
+            return self._bundle_name_cache[app_path]
+
+        name = self._load_macos_app_name_from_bundle(app_path)
+        self._bundle_name_cache[app_path] = name
+        return name
+
+    def _load_macos_app_name_from_bundle(self, app_path: str) -> Optional[str]:
+        """Load application name from macOS bundle."""
         try:
             # Check if required classes are available
             if NSURL is None or NSBundle is None:
@@ -57,33 +98,38 @@ class ProcessNameResolver:
             pass
         return None
 
-    def _get_macos_friendly_name(self, proc: psutil.Process, default_name: str) -> str:
+    @staticmethod
+    def get_app_bundle_path(exe_path: str) -> Optional[str]:
+        """Return the enclosing .app bundle path of a macOS executable, or None if it is not inside one."""
+        bundle_prefix, separator, _ = exe_path.partition(".app/")
+        if separator:
+            return bundle_prefix + ".app"
+        return None
+
+    def _get_macos_friendly_name(self, proc: psutil.Process, default_name: str, pid_map: Optional[dict[int, str]] = None) -> str:
         """Get friendly name for macOS processes."""
         try:
             # Check if NSWorkspace is available
             if NSWorkspace is None:
                 return default_name
 
-            # Try to get the application name using NSRunningApplication
-            workspace = NSWorkspace.sharedWorkspace()
-            for app in workspace.runningApplications():
-                if app.processIdentifier() == proc.pid:
-                    # Try to get the localized name first
-                    if app.localizedName():
-                        return str(app.localizedName())
+            # Try to get the localized application name from the running applications,
+            # asking AppKit for just this pid when no refresh-wide snapshot was passed in
+            if pid_map is not None:
+                localized_name = pid_map.get(proc.pid)
+            else:
+                app = NSRunningApplication.runningApplicationWithProcessIdentifier_(proc.pid)
+                localized_name = str(app.localizedName()) if app and app.localizedName() else None
+            if localized_name:
+                return localized_name
 
             # If we couldn't get the name from NSRunningApplication, try the bundle path
             try:
-                exe_path = proc.exe()
-                if ".app" in exe_path:
-                    # Find the .app bundle path
-                    app_path = exe_path
-                    app_index = exe_path.find(".app")
-                    if app_index != -1:
-                        app_path = exe_path[: app_index + 4]
-                        bundle_name = self._get_macos_app_name_from_bundle(app_path)
-                        if bundle_name:
-                            return bundle_name
+                bundle_path = self.get_app_bundle_path(proc.exe())
+                if bundle_path:
+                    bundle_name = self._get_macos_app_name_from_bundle(bundle_path)
+                    if bundle_name:
+                        return bundle_name
             except (psutil.AccessDenied, psutil.NoSuchProcess):
                 pass
 
@@ -93,51 +139,144 @@ class ProcessNameResolver:
 
         return default_name
 
+    def get_running_app_names(self) -> Optional[dict[int, str]]:
+        """
+        Snapshot running macOS applications as pid -> localized name.
+        Returns None on other platforms, where no snapshot is needed.
+        """
+        if not _IS_DARWIN or NSWorkspace is None:
+            return None
+
+        try:
+            apps = NSWorkspace.sharedWorkspace().runningApplications()
+            return {int(app.processIdentifier()): str(app.localizedName()) for app in apps if app.localizedName()}
+        except Exception as e:
+            print(f"Error listing running applications: {str(e)}")
+            return {}
+
+    @staticmethod
+    def _read_desktop_entry(file_path: str) -> Optional[tuple[str, str]]:
+        """Read (executable basename, Name) from a .desktop file."""
+        parser = configparser.ConfigParser(interpolation=None, strict=False)
+        parser.optionxform = str  # type: ignore[assignment,method-assign]
+        try:
+            parser.read(file_path, encoding="utf-8")
+            entry = parser["Desktop Entry"]
+            try_exec = entry.get("TryExec", "").strip()
+            name = entry.get("Name", "").strip()
+            # TryExec names the actual binary, so prefer it over the Exec command line
+            exec_args = [try_exec] if try_exec else shlex.split(entry.get("Exec", ""))
+        except Exception:
+            return None
+
+        # Look through "env VAR=value program ..." to the program it starts
+        if exec_args and exec_args[0].rpartition("/")[2] == "env":
+            exec_args = exec_args[1:]
+            while exec_args and ("=" in exec_args[0] or exec_args[0].startswith("-")):
+                exec_args = exec_args[1:]
+
+        if not exec_args or not name:
+            return None
+        executable = exec_args[0].rpartition("/")[2]
+        if executable in _DESKTOP_EXEC_WRAPPERS:
+            return None
+        return executable, name
+
+    def _refresh_desktop_index(self) -> None:
+        """Rebuild the .desktop index if any applications directory changed since the last build."""
+        with self._desktop_lock:
+            now = time.monotonic()
+            if self._desktop_checked_at is not None and now - self._desktop_checked_at < self._cache_expiration:
+                return
+            self._desktop_checked_at = now
+
+            mtimes: dict[str, float] = {}
+            for desktop_path in self._desktop_paths:
+                try:
+                    mtimes[desktop_path] = os.stat(desktop_path).st_mtime
+                except OSError:
+                    continue
+            if mtimes == self._desktop_mtime:
+                return
+
+            index: dict[str, str] = {}
+            for desktop_path in mtimes:
+                try:
+                    files = sorted(os.listdir(desktop_path))
+                except OSError:
+                    continue
+                for file in files:
+                    if not file.endswith(".desktop"):
+                        continue
+                    entry = self._read_desktop_entry(os.path.join(desktop_path, file))
+                    if entry is not None:
+                        # Earlier directories take precedence
+                        index.setdefault(*entry)
+
+            self._desktop_index = index
+            self._desktop_mtime = mtimes
+
     def _get_linux_friendly_name(self, proc: psutil.Process, default_name: str) -> str:
         """Get friendly name for Linux processes."""
+        # Read the /proc symlink directly, skipping psutil's validation around the same readlink
         try:
-            # Try to get name from .desktop files
-            if hasattr(proc, "exe"):
-                exe_path = proc.exe()
-                desktop_paths = [
-                    "/usr/share/applications/",
-                    "/usr/local/share/applications/",
-                    os.path.expanduser("~/.local/share/applications/"),
-                ]
-
-                exe_name = os.path.basename(exe_path)
-                for desktop_path in desktop_paths:
-                    for file in os.listdir(desktop_path):
-                        if file.endswith(".desktop"):
-                            try:
-                                with open(os.path.join(desktop_path, file), "r", encoding="utf-8") as f:
-                                    content = f.read()
-                                    if exe_name in content:
-                                        for line in content.split("\n"):
-                                            if line.startswith("Name="):
-                                                return line[5:].strip()
-                            except Exception:
-                                continue
-        except Exception:
-            pass
+            exe_path = os.readlink(f"/proc/{proc.pid}/exe")
+        except OSError:
+            return default_name
+        if not exe_path:
+            return default_name
+        # The kernel marks executables replaced since launch (e.g. by a package upgrade)
+        exe_path = exe_path.removesuffix(" (deleted)")
 
-        return default_name
+        # Look the executable up in the index of .desktop files
+        self._refresh_desktop_index()
+        return self._desktop_index.get(exe_path.rpartition("/")[2], default_name)
 
-    def get_friendly_name(self, proc: psutil.Process) -> str:
+    def get_friendly_name(self, proc: psutil.Process, pid_map: Optional[dict[int, str]] = None) -> str:
         """
         Get a user-friendly name for a process.
         This method is platform-aware and will use the appropriate method for each OS.
+
+        On macOS, pid_map can carry a pid -> localized name snapshot of running applications,
+        so resolving many processes enumerates NSWorkspace once instead of once per process.
+
+        Results are cached per (pid, create_time), so a reused pid never gets a stale name.
         """
+        try:
+            key: Optional[tuple[int, float]] = (proc.pid, proc.create_time())
+        except Exception:
+            key = None
+
+        now = time.monotonic()
+        if key is not None:
+            with self._cache_lock:
+                cached = self._cache.get(key)
+                if cached is not None and now - cached[1] < self._cache_expiration:
+                    self._cache.move_to_end(key)
+                    return cached[0]
+
+        friendly_name = self._resolve_friendly_name(proc, pid_map)
+
+        if key is not None:
+            with self._cache_lock:
+                self._cache[key] = (friendly_name, now)
+                self._cache.move_to_end(key)
+                while len(self._cache) > self._cache_max_size:
+                    self._cache.popitem(last=False)
+
+        return friendly_name
+
+    def _resolve_friendly_name(self, proc: psutil.Process, pid_map: Optional[dict[int, str]]) -> str:
+        """Resolve a friendly name without consulting the cache."""
         try:
             # Get process info using as_dict() method
             proc_info = proc.as_dict(attrs=["name"])
             default_name = proc_info["name"]
 
             # Use platform-specific name resolution
-            system = platform.system()
-            if system == "Darwin":
-                return self._get_macos_friendly_name(proc, default_name)
-            elif system == "Linux":
+            if _IS_DARWIN:
+                return self._get_macos_friendly_name(proc, default_name, pid_map)
+            elif _IS_LINUX:
                 return self._get_linux_friendly_name(proc, default_name)
 
             return default_name
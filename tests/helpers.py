@@ -0,0 +1,50 @@
+from unittest import mock
+
+from wox_plugin import Context, PluginInitParams, PublicAPI, Query
+
+from src.main import MyPlugin, ProcessInfo
+
+TEMPLATES = {
+    "process_title": "{friendly_name} ({pid})",
+    "tail_pid": "PID: {pid}",
+    "tail_memory": "{memory_mb} MB",
+}
+
+
+def make_api() -> mock.AsyncMock:
+    """Create a stub Wox API that serves translation templates and accepts every call."""
+    api = mock.AsyncMock(spec=PublicAPI)
+    api.get_translation.side_effect = lambda ctx, key: TEMPLATES.get(key, key)
+    api.is_visible.return_value = True
+    return api
+
+
+def make_query(search: str) -> Query:
+    return mock.Mock(spec=Query, search=search)
+
+
+def make_process(
+    pid: int, name: str, exe_path: str = "", friendly_name: str = "", memory_mb: float = 1.0, create_time: float = 0.0
+) -> ProcessInfo:
+    return ProcessInfo(
+        pid=pid,
+        name=name,
+        exe_path=exe_path,
+        username="user",
+        memory_mb=memory_mb,
+        friendly_name=friendly_name or name,
+        create_time=create_time,
+    )
+
+
+async def make_plugin(api: mock.AsyncMock, processes: list[ProcessInfo]) -> MyPlugin:
+    """Create an initialized plugin whose cache holds the given processes instead of a real scan."""
+    plugin = MyPlugin()
+    await plugin.init(Context.new(), PluginInitParams(api=api, plugin_directory=""))
+    # Cancelled before it first runs, so the background refresh never replaces the given processes
+    assert plugin._refresh_task is not None
+    plugin._refresh_task.cancel()
+
+    await plugin._render_processes(processes)
+    plugin._publish_processes({p.pid: p for p in processes}, processes)
+    return plugin
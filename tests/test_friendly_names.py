@@ -1,5 +1,8 @@
+import os
 import platform
+import tempfile
 import unittest
+from unittest import mock
 
 import psutil
 
@@ -20,14 +23,18 @@ class TestProcessNameResolver(unittest.TestCase):
         print("-" * 100)
 
         found_different_name = False
+        found_indexed_process = False
         processes_checked = 0
         different_checked = 0
 
         for proc in psutil.process_iter(["pid", "name", "exe", "cmdline"]):
             try:
-                proc_info = proc.as_dict(attrs=["pid", "name"])
+                proc_info = proc.as_dict(attrs=["pid", "name", "exe"])
                 original_name = proc_info["name"]
                 friendly_name = self.resolver.get_friendly_name(proc)
+                indexed_name = self.resolver._desktop_index.get((proc_info["exe"] or "").rpartition("/")[2])
+                if indexed_name and indexed_name != original_name:
+                    found_indexed_process = True
                 changed = "✓" if original_name != friendly_name else ""
                 print(f"{proc.pid:<10} {original_name:<30} {friendly_name:<40} {changed:<10}")
                 processes_checked += 1
@@ -42,11 +49,85 @@ class TestProcessNameResolver(unittest.TestCase):
         print(f"\nProcesses checked: {processes_checked}")
         print(f"Different names checked: {different_checked}")
 
+        # On Linux friendly names come from .desktop files, so a machine running no desktop apps has none to show
+        if platform.system() == "Linux" and not found_indexed_process:
+            self.skipTest("No running process is launched by an installed .desktop file")
+
         self.assertTrue(
             found_different_name,
             "No processes were found with different friendly names. The friendly name resolver might not be working correctly.",
         )
 
+    def test_friendly_name_is_cached_per_process(self):
+        """Test that repeated lookups for the same process are served from the cache"""
+        proc = psutil.Process(os.getpid())
+        with mock.patch.object(self.resolver, "_resolve_friendly_name", return_value="Cached Name") as resolve:
+            self.assertEqual(self.resolver.get_friendly_name(proc), "Cached Name")
+            self.assertEqual(self.resolver.get_friendly_name(proc), "Cached Name")
+        resolve.assert_called_once()
+
+    def test_friendly_name_cache_is_bounded(self):
+        """Test that the cache evicts least recently used entries beyond its size limit"""
+        self.resolver._cache_max_size = 1
+        current = psutil.Process(os.getpid())
+        parent = psutil.Process(os.getppid())
+        with mock.patch.object(self.resolver, "_resolve_friendly_name", return_value="Name"):
+            self.resolver.get_friendly_name(current)
+            self.resolver.get_friendly_name(parent)
+        self.assertEqual(list(self.resolver._cache), [(parent.pid, parent.create_time())])
+
+    def test_linux_desktop_index_lookup(self):
+        """Test that executables are matched to the Name of the .desktop file that launches them"""
+        with tempfile.TemporaryDirectory() as desktop_dir:
+            with open(os.path.join(desktop_dir, "example.desktop"), "w", encoding="utf-8") as f:
+                f.write("[Desktop Entry]\nType=Application\nName=Example App\nName[de]=Beispiel\nExec=/opt/example/bin/example %U\n")
+            self.resolver._desktop_paths = [desktop_dir]
+
+            proc = mock.Mock(spec=psutil.Process, pid=1234)
+            with mock.patch("src.process_name_resolver.os.readlink", return_value="/opt/example/bin/example") as readlink:
+                self.assertEqual(self.resolver._get_linux_friendly_name(proc, "example"), "Example App")
+                readlink.assert_called_once_with("/proc/1234/exe")
+
+            with mock.patch("src.process_name_resolver.os.readlink", return_value="/opt/example/bin/example (deleted)"):
+                self.assertEqual(self.resolver._get_linux_friendly_name(proc, "example"), "Example App")
+
+            with mock.patch("src.process_name_resolver.os.readlink", return_value="/usr/bin/other"):
+                self.assertEqual(self.resolver._get_linux_friendly_name(proc, "other"), "other")
+
+            with mock.patch("src.process_name_resolver.os.readlink", side_effect=PermissionError):
+                self.assertEqual(self.resolver._get_linux_friendly_name(proc, "example"), "example")
+
+    def test_linux_desktop_entry_looks_through_launchers(self):
+        """Test that env prefixes, TryExec and shell wrappers are handled when indexing .desktop files"""
+        entries = {
+            "env.desktop": "Name=Env App\nExec=env FOO=1 BAR=2 /opt/env-app/bin/envapp %U\n",
+            "tryexec.desktop": "Name=Try App\nTryExec=/opt/try/bin/tryapp\nExec=/opt/try/launch.sh\n",
+            "shell.desktop": 'Name=Shell App\nExec=sh -c "cd /opt/shell && ./run"\n',
+        }
+        with tempfile.TemporaryDirectory() as desktop_dir:
+            for file_name, body in entries.items():
+                with open(os.path.join(desktop_dir, file_name), "w", encoding="utf-8") as f:
+                    f.write("[Desktop Entry]\nType=Application\n" + body)
+            self.resolver._desktop_paths = [desktop_dir]
+            self.resolver._refresh_desktop_index()
+
+        self.assertEqual(self.resolver._desktop_index, {"envapp": "Env App", "tryapp": "Try App"})
+
+    def test_macos_friendly_name_without_snapshot_looks_up_pid(self):
+        """Test that without a running-applications snapshot the app is looked up by its pid alone"""
+        proc = mock.Mock(spec=psutil.Process, pid=1234)
+        app = mock.Mock()
+        app.localizedName.return_value = "Safari"
+        with (
+            mock.patch("src.process_name_resolver.NSWorkspace") as workspace,
+            mock.patch("src.process_name_resolver.NSRunningApplication") as running_application,
+        ):
+            running_application.runningApplicationWithProcessIdentifier_.return_value = app
+            self.assertEqual(self.resolver._get_macos_friendly_name(proc, "safari"), "Safari")
+
+        running_application.runningApplicationWithProcessIdentifier_.assert_called_once_with(1234)
+        workspace.sharedWorkspace.assert_not_called()
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,254 @@
+import asyncio
+import os
+import unittest
+from unittest import mock
+
+import psutil
+from wox_plugin import Context, LogLevel, PluginInitParams
+
+from src.main import MyPlugin, ProcessInfo
+from tests.helpers import TEMPLATES, make_api, make_plugin, make_process, make_query
+
+
+class TestProcessCache(unittest.TestCase):
+    def setUp(self):
+        self.plugin = MyPlugin()
+        self.plugin._processes = {}
+
+    def test_known_process_is_carried_forward(self):
+        """Test that a process seen in the previous refresh keeps its cached entry"""
+        proc = psutil.Process(os.getpid())
+        known = ProcessInfo(
+            pid=proc.pid,
+            name="python",
+            exe_path="",
+            username="",
+            memory_mb=0.0,
+            friendly_name="python",
+            create_time=proc.create_time(),
+        )
+        self.plugin._processes = {proc.pid: known}
+
+        collected, newcomers = self.plugin._collect_processes([proc])
+
+        self.assertIs(collected[proc.pid], known)
+        self.assertEqual(newcomers, [])
+
+    def test_reused_pid_is_treated_as_new(self):
+        """Test that a cached Process whose pid was reused does not inherit the old entry"""
+        pid = os.getpid()
+        stale_create_time = psutil.Process(pid).create_time() - 1000
+        self.plugin._processes = {
+            pid: ProcessInfo(
+                pid=pid,
+                name="old",
+                exe_path="/usr/bin/old",
+                username="",
+                memory_mb=0.0,
+                friendly_name="Old App",
+                create_time=stale_create_time,
+            )
+        }
+
+        # Simulate the object process_iter() cached for the previous owner of this pid
+        stale = psutil.Process(pid)
+        stale._create_time = stale_create_time
+        stale._ident = (pid, stale_create_time)
+
+        collected, newcomers = self.plugin._collect_processes([stale])
+
+        self.assertEqual(collected, {})
+        self.assertEqual(len(newcomers), 1)
+        proc, create_time, _ = newcomers[0]
+        self.assertIsNot(proc, stale)
+        self.assertEqual(create_time, psutil.Process(pid).create_time())
+
+
+class TestRefreshLoop(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.api = make_api()
+        self.plugin = MyPlugin()
+        await self.plugin.init(Context.new(), PluginInitParams(api=self.api, plugin_directory=""))
+
+    async def asyncTearDown(self):
+        await self.plugin._on_unload(Context.new())
+
+    async def test_first_query_does_not_hang_when_first_refresh_fails(self):
+        """Test that query() returns instead of waiting forever when the initial scan fails"""
+        self.api.get_translation.side_effect = RuntimeError("rpc down")
+
+        results = await asyncio.wait_for(self.plugin.query(Context.new(), make_query("")), timeout=5)
+
+        self.assertEqual(results, [])
+
+    async def test_refresh_loop_survives_a_failing_tick(self):
+        """Test that a refresh failing on an RPC is retried instead of stopping the refresh task"""
+        self.api.get_translation.side_effect = RuntimeError("rpc down")
+        await asyncio.wait_for(self.plugin._ready.wait(), timeout=5)
+
+        self.api.get_translation.side_effect = lambda ctx, key: TEMPLATES.get(key, key)
+        self.plugin._refresh_event.set()
+        for _ in range(500):
+            if self.plugin._process_list:
+                break
+            await asyncio.sleep(0.01)
+
+        self.assertFalse(self.plugin._refresh_task.done())
+        self.assertTrue(self.plugin._process_list)
+        self.api.log.assert_awaited_once_with(mock.ANY, LogLevel.ERROR, "Error refreshing processes: rpc down")
+
+    async def test_repeated_errors_are_logged_once_and_log_failures_ignored(self):
+        """Test that a persistent failure is logged once, and a failing log RPC does not raise"""
+        self.api.log.side_effect = RuntimeError("connection lost")
+
+        await self.plugin._log_error(Context.new(), "Error refreshing processes: rpc down")
+        await self.plugin._log_error(Context.new(), "Error refreshing processes: rpc down")
+
+        self.api.log.assert_awaited_once()
+
+
+class TestTrackedResults(unittest.IsolatedAsyncioTestCase):
+    async def test_stale_update_keeps_results_tracked_by_a_newer_query(self):
+        """Test that a refresh finishing after a new query does not untrack that query's results"""
+        api = make_api()
+        process = make_process(100, "editor")
+        plugin = await make_plugin(api, [process])
+        await plugin.query(Context.new(), make_query("edit"))
+
+        # Hold the update RPC so a second query can run while it is in flight
+        release = asyncio.Event()
+
+        async def get_updatable_result(ctx, result_id):
+            # By the time the update is answered, the result is gone from the screen
+            await release.wait()
+
+        api.get_updatable_result.side_effect = get_updatable_result
+        process.memory_text = "2.0 MB"
+        update = asyncio.create_task(plugin._update_tracked_results())
+        await asyncio.sleep(0)
+
+        await plugin.query(Context.new(), make_query("edit"))
+        release.set()
+        await update
+
+        self.assertEqual(list(plugin._tracked_results), [process.result_id])
+
+    async def test_visibility_check_failure_still_updates_results(self):
+        """Test that a failing is_visible RPC neither raises nor stops tracked results from updating"""
+        api = make_api()
+        process = make_process(100, "editor")
+        plugin = await make_plugin(api, [process])
+        await plugin.query(Context.new(), make_query("edit"))
+        api.is_visible.side_effect = RuntimeError("no such method")
+        process.memory_text = "2.0 MB"
+
+        await plugin._update_tracked_results()
+
+        api.update_result.assert_awaited_once()
+        self.assertEqual(list(plugin._tracked_results), [process.result_id])
+
+
+class TestRendering(unittest.IsolatedAsyncioTestCase):
+    async def test_render_reuses_last_templates_when_fetch_fails(self):
+        """Test that titles still render from the last good templates when translations cannot be fetched"""
+        api = make_api()
+        plugin = await make_plugin(api, [make_process(100, "editor")])
+        plugin.invalidate_translations()
+        api.get_translation.side_effect = RuntimeError("rpc down")
+        process = make_process(200, "shell")
+
+        await plugin._render_processes([process])
+
+        self.assertEqual(process.title, "shell (200)")
+        self.assertEqual(process.pid_text, "PID: 200")
+
+
+class TestRefresh(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.plugin = await make_plugin(make_api(), [])
+
+    async def asyncTearDown(self):
+        await self.plugin._on_unload(Context.new())
+
+    async def test_app_snapshot_is_only_taken_for_new_processes(self):
+        """Test that running applications are only enumerated when a refresh finds new processes"""
+        proc = psutil.Process(os.getpid())
+        with (
+            mock.patch("src.main._APP_SNAPSHOT_MIN_NEWCOMERS", 1),
+            mock.patch.object(psutil, "process_iter", return_value=[proc]),
+            mock.patch.object(self.plugin.name_resolver, "get_running_app_names", return_value={}) as snapshot,
+        ):
+            await self.plugin._refresh_processes()
+            snapshot.assert_called_once()
+            self.assertEqual(list(self.plugin._processes), [proc.pid])
+
+            await self.plugin._refresh_processes()
+            snapshot.assert_called_once()
+
+    async def test_small_batch_is_resolved_per_pid(self):
+        """Test that a few new processes are named without enumerating all running applications"""
+        proc = psutil.Process(os.getpid())
+        with (
+            mock.patch.object(psutil, "process_iter", return_value=[proc]),
+            mock.patch.object(self.plugin.name_resolver, "get_running_app_names") as snapshot,
+            mock.patch.object(self.plugin.name_resolver, "get_friendly_name", return_value="Python") as resolve,
+        ):
+            await self.plugin._refresh_processes()
+
+        snapshot.assert_not_called()
+        resolve.assert_called_once_with(mock.ANY, None)
+        self.assertEqual(self.plugin._processes[proc.pid].friendly_name, "Python")
+
+
+class TestKillProcess(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.api = make_api()
+        # Our own pid, so the identity check sees a live process; os.kill is always mocked
+        self.pid = os.getpid()
+        self.create_time = psutil.Process(self.pid).create_time()
+        self.plugin = await make_plugin(self.api, [make_process(self.pid, "python", create_time=self.create_time)])
+
+    async def kill(self, pid: int, side_effect=None) -> mock.Mock:
+        with mock.patch("src.main._IS_WINDOWS", False), mock.patch("src.main.os.kill", side_effect=side_effect) as kill:
+            await self.plugin.kill_process(Context.new(), pid)
+        self.api.notify.assert_awaited_once()
+        return kill
+
+    def notification(self) -> str:
+        return self.api.notify.await_args.args[1]
+
+    async def test_kill_notifies_success(self):
+        kill = await self.kill(self.pid)
+        kill.assert_called_once()
+        self.assertEqual(self.notification(), "notify_success")
+
+    async def test_exited_process_notifies_no_process(self):
+        await self.kill(self.pid, ProcessLookupError())
+        self.assertEqual(self.notification(), "notify_no_process")
+
+    async def test_permission_error_notifies_access_denied(self):
+        await self.kill(self.pid, PermissionError())
+        self.assertEqual(self.notification(), "notify_access_denied")
+
+    async def test_uncached_pid_is_not_signalled(self):
+        kill = await self.kill(999999)
+        kill.assert_not_called()
+        self.assertEqual(self.notification(), "notify_no_process")
+
+    async def test_pid_zero_is_never_signalled(self):
+        """Test that pid 0 is refused, since os.kill(0) would signal the plugin host's own process group"""
+        self.plugin._processes[0] = make_process(0, "kernel_task")
+        kill = await self.kill(0)
+        kill.assert_not_called()
+        self.assertEqual(self.notification(), "notify_access_denied")
+
+    async def test_reused_pid_is_not_signalled(self):
+        """Test that a pid now owned by a different process than the one listed is not signalled"""
+        self.plugin._processes[self.pid].create_time = self.create_time - 1000
+        kill = await self.kill(self.pid)
+        kill.assert_not_called()
+        self.assertEqual(self.notification(), "notify_no_process")
+
+
+if __name__ == "__main__":
+    unittest.main()
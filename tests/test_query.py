@@ -1,6 +1,10 @@
 import unittest
+from unittest import mock
+
+from wox_plugin import Context
 
 from src.main import MyPlugin
+from tests.helpers import make_api, make_plugin, make_process, make_query
 
 
 class TestMyPlugin(unittest.TestCase):
@@ -12,5 +16,45 @@ class TestMyPlugin(unittest.TestCase):
         self.assertIsNotNone(results)
 
 
+class TestQueryResults(unittest.IsolatedAsyncioTestCase):
+    async def test_name_matches_outrank_path_matches(self):
+        """Test that processes matching by name are listed before processes matching only by path"""
+        path_match = make_process(100, "helper", exe_path="/opt/editor/bin/helper")
+        name_match = make_process(200, "editor", exe_path="/usr/bin/editor")
+        no_match = make_process(300, "shell", exe_path="/bin/sh")
+        plugin = await make_plugin(make_api(), [path_match, name_match, no_match])
+
+        results = await plugin.query(Context.new(), make_query("Editor"))
+
+        self.assertEqual([r.id for r in results], [name_match.result_id, path_match.result_id])
+        self.assertEqual([r.score for r in results], [100, 50])
+        self.assertEqual(results[0].title, "editor (200)")
+        self.assertEqual(results[0].actions[0].context_data, {"pid": "200"})
+        self.assertEqual(set(plugin._tracked_results), {name_match.result_id, path_match.result_id})
+
+    async def test_search_keeps_best_matches_up_to_limit(self):
+        """Test that a search returns at most _MAX_RESULTS results and cuts the lowest scored ones"""
+        path_matches = [make_process(pid, f"helper{pid}", exe_path=f"/opt/editor/{pid}") for pid in range(100, 104)]
+        name_match = make_process(200, "editor")
+        plugin = await make_plugin(make_api(), [*path_matches, name_match])
+
+        with mock.patch("src.main._MAX_RESULTS", 2):
+            results = await plugin.query(Context.new(), make_query("editor"))
+
+        self.assertEqual([r.id for r in results], [name_match.result_id, path_matches[0].result_id])
+        self.assertEqual(len(plugin._tracked_results), 2)
+
+    async def test_empty_search_is_capped(self):
+        """Test that an empty search lists processes in cache order up to _MAX_RESULTS"""
+        processes = [make_process(pid, f"proc{pid}") for pid in range(100, 105)]
+        plugin = await make_plugin(make_api(), processes)
+
+        with mock.patch("src.main._MAX_RESULTS", 3):
+            results = await plugin.query(Context.new(), make_query(""))
+
+        self.assertEqual([r.id for r in results], [p.result_id for p in processes[:3]])
+        self.assertEqual({r.score for r in results}, {50})
+
+
 if __name__ == "__main__":
     unittest.main()